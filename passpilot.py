@@ -27,16 +27,44 @@ import string
 import secrets
 import re
 import math
+import bisect
 import hashlib
 import requests
 import json
-from datetime import datetime
-from collections import Counter
+import sqlite3
+import gzip
+import time
 import threading
+from datetime import datetime
+from collections import Counter, deque
+import queue
+from functools import lru_cache
 import gettext
 import locale
 import os
 
+# Optional HTTP/2 client: one keep-alive connection amortizes the TLS
+# handshake across breach checks. Falls back to a pooled requests session.
+# Add-Padding makes HIBP pad range responses so response size does not
+# leak which prefix was queried to a traffic observer.
+_HIBP_HEADERS = {"User-Agent": "PassPilot/2", "Add-Padding": "true"}
+
+try:
+    import httpx
+    _HTTP_CLIENT = httpx.Client(http2=True, timeout=5.0, headers=_HIBP_HEADERS)
+except Exception:
+    _HTTP_CLIENT = None
+
+# Optional C JSON encoder for history export; stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HIBP_SESSION = requests.Session()
+_HIBP_SESSION.headers.update(_HIBP_HEADERS)
+_HIBP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # Internationalization setup
 locale.setlocale(locale.LC_ALL, '')
 lang = locale.getlocale()[0]
@@ -51,6 +79,17 @@ _ = gettext.gettext
 
 # --- Advanced Password Generator ---
 
+# Built-in passphrase word list (simplified version); immutable and built
+# once instead of per generate_passphrase call.
+_PASSPHRASE_WORDS = (
+    "correct", "horse", "battery", "staple", "dragon", "mountain", "river", "forest",
+    "thunder", "crystal", "phoenix", "shadow", "silver", "golden", "mystic", "cosmic",
+    "aurora", "nebula", "quantum", "stellar", "lunar", "solar", "ocean", "summit",
+    "falcon", "tiger", "eagle", "wolf", "bear", "lion", "hawk", "cobra",
+    "velocity", "infinity", "destiny", "legacy", "wisdom", "courage", "honor", "justice"
+)
+
+
 class AdvancedPasswordGenerator:
     """Next-generation password generator with intelligent algorithms."""
     
@@ -63,49 +102,80 @@ class AdvancedPasswordGenerator:
         "Paranoid": {"length": 64, "lower": True, "upper": True, "digits": True, "symbols": True}
     }
     
+    _LOWER = string.ascii_lowercase.encode('ascii')
+    _UPPER = string.ascii_uppercase.encode('ascii')
+    _DIGITS = string.digits.encode('ascii')
+    _SYMBOLS = b"!@#$%^&*()-_=+[]{}|;:,.<>?/"
+
+    # Ambiguous-character-free variants, stripped once at class definition.
+    _LOWER_NA = _LOWER.translate(None, b'lo')
+    _UPPER_NA = _UPPER.translate(None, b'IO')
+    _DIGITS_NA = _DIGITS.translate(None, b'01')
+    _SYMBOLS_NA = _SYMBOLS.translate(None, b'|l')
+
+    # Pool bytes memoized by (class flags, exclude_ambiguous) so repeated
+    # generate() calls skip pool concatenation entirely.
+    _POOL_CACHE = {}
+
     def __init__(self):
-        self.history = []
         self.max_history = 50
-    
+        self.history = deque(maxlen=self.max_history)
+        self._rng = secrets.SystemRandom()
+
+    @classmethod
+    def _class_pools(cls, use_lower, use_upper, use_digits, use_symbols, exclude_ambiguous):
+        """Return the per-class pool strings for a flag combination, cached."""
+        key = (use_lower, use_upper, use_digits, use_symbols, exclude_ambiguous)
+        pools = cls._POOL_CACHE.get(key)
+        if pools is None:
+            if exclude_ambiguous:
+                bases = (cls._LOWER_NA, cls._UPPER_NA, cls._DIGITS_NA, cls._SYMBOLS_NA)
+            else:
+                bases = (cls._LOWER, cls._UPPER, cls._DIGITS, cls._SYMBOLS)
+            per_class = tuple(pool for flag, pool in zip(key, bases) if flag)
+            joined = b"".join(per_class)
+            limit = 256 - (256 % len(joined)) if joined else 0
+            pools = (per_class, joined, limit)
+            cls._POOL_CACHE[key] = pools
+        return pools
+
+    @staticmethod
+    def _draw_chars(pool, count, limit=None):
+        """Draw `count` uniform pool bytes in batched CSPRNG calls.
+
+        One token_bytes draw covers the whole request instead of one
+        randbelow round-trip per character; bytes at or above the largest
+        multiple of len(pool) are rejected to avoid modulo bias.
+        """
+        k = len(pool)
+        if limit is None:
+            limit = 256 - (256 % k)
+        out = bytearray()
+        needed = count
+        while needed > 0:
+            for b in secrets.token_bytes(needed * 2):
+                if b < limit:
+                    out.append(pool[b % k])
+                    needed -= 1
+                    if needed == 0:
+                        break
+        return out
+
     def generate(self, length, use_lower, use_upper, use_digits, use_symbols, exclude_ambiguous=False):
         """Generate a cryptographically secure password."""
-        char_pool = []
-        password_chars = []
-        
-        lower = string.ascii_lowercase
-        upper = string.ascii_uppercase
-        digits = string.digits
-        symbols = "!@#$%^&*()-_=+[]{}|;:,.<>?/"
-        
-        # Exclude ambiguous characters if requested
-        if exclude_ambiguous:
-            lower = lower.replace('l', '').replace('o', '')
-            upper = upper.replace('I', '').replace('O', '')
-            digits = digits.replace('0', '').replace('1', '')
-            symbols = symbols.replace('|', '').replace('l', '')
-        
-        if use_lower:
-            char_pool.extend(lower)
-            password_chars.append(secrets.choice(lower))
-        if use_upper:
-            char_pool.extend(upper)
-            password_chars.append(secrets.choice(upper))
-        if use_digits:
-            char_pool.extend(digits)
-            password_chars.append(secrets.choice(digits))
-        if use_symbols:
-            char_pool.extend(symbols)
-            password_chars.append(secrets.choice(symbols))
-        
+        per_class, char_pool, limit = self._class_pools(use_lower, use_upper, use_digits, use_symbols, exclude_ambiguous)
         if not char_pool:
             return ""
-        
-        remaining = length - len(password_chars)
-        if remaining > 0:
-            password_chars.extend(secrets.choice(char_pool) for _ in range(remaining))
-        
-        secrets.SystemRandom().shuffle(password_chars)
-        password = "".join(password_chars)
+
+        # Fill the whole buffer from the batched sampler, then plant one
+        # guaranteed pick per class at distinct random positions — no
+        # final shuffle pass needed.
+        password_bytes = self._draw_chars(char_pool, length, limit)
+        positions = self._rng.sample(range(length), min(len(per_class), length))
+        for idx, pool in zip(positions, per_class):
+            password_bytes[idx] = self._rng.choice(pool)
+
+        password = password_bytes.decode('ascii')
         
         # Add to history
         self.add_to_history(password)
@@ -113,20 +183,17 @@ class AdvancedPasswordGenerator:
     
     def generate_passphrase(self, word_count=5, separator="-", capitalize=True, add_number=True):
         """Generate a memorable passphrase using common words."""
-        # Built-in word list (simplified version)
-        words = [
-            "correct", "horse", "battery", "staple", "dragon", "mountain", "river", "forest",
-            "thunder", "crystal", "phoenix", "shadow", "silver", "golden", "mystic", "cosmic",
-            "aurora", "nebula", "quantum", "stellar", "lunar", "solar", "ocean", "summit",
-            "falcon", "tiger", "eagle", "wolf", "bear", "lion", "hawk", "cobra",
-            "velocity", "infinity", "destiny", "legacy", "wisdom", "courage", "honor", "justice"
-        ]
-        
-        selected = [secrets.choice(words) for _ in range(word_count)]
-        if capitalize:
-            selected = [w.capitalize() for w in selected]
-        
+        # choices() draws all words in one C-level call
+        selected = self._rng.choices(_PASSPHRASE_WORDS, k=word_count)
+
         passphrase = separator.join(selected)
+        if capitalize:
+            if separator and not separator.isalpha():
+                # One C-level pass: title() upcases after each non-alpha
+                # separator, matching per-word capitalize for this word list.
+                passphrase = passphrase.title()
+            else:
+                passphrase = separator.join(w.capitalize() for w in selected)
         if add_number:
             passphrase += separator + str(secrets.randbelow(9999))
         
@@ -134,120 +201,341 @@ class AdvancedPasswordGenerator:
         return passphrase
     
     def add_to_history(self, password):
-        """Add password to session history."""
+        """Add password to history as a (time, password, display) tuple.
+
+        The truncated display string shown in the history list is built
+        once here rather than on every refresh.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.history.insert(0, {"password": password, "time": timestamp})
-        if len(self.history) > self.max_history:
-            self.history.pop()
+        if len(password) > 40:
+            display = f"[{timestamp}] {password[:40]}..."
+        else:
+            display = f"[{timestamp}] {password}"
+        self.history.appendleft((timestamp, password, display))
 
 # --- Advanced Password Analyzer ---
 
+# Character-class bitmask scan: each byte maps to a 4-bit class flag so a
+# single pass over the password replaces four separate regex probes.
+_CLASS_LOWER, _CLASS_UPPER, _CLASS_DIGIT, _CLASS_SYMBOL = 1, 2, 4, 8
+_CLASS_TABLE = bytes(
+    _CLASS_LOWER if chr(b) in string.ascii_lowercase else
+    _CLASS_UPPER if chr(b) in string.ascii_uppercase else
+    _CLASS_DIGIT if chr(b) in string.digits else
+    _CLASS_SYMBOL
+    for b in range(256)
+)
+# Pool size for each possible class-mask (subset sums of 26/26/10/32),
+# with log2 precomputed so entropy needs no libm call per keystroke.
+_POOL_SIZE_BY_MASK = (0, 26, 26, 52, 10, 36, 36, 62, 32, 58, 58, 84, 42, 68, 68, 94)
+_LOG2_POOL_BY_MASK = tuple(math.log2(s) if s else 0.0 for s in _POOL_SIZE_BY_MASK)
+
+
+# Strength analysis is capped at this many characters (zxcvbn guidance):
+# beyond it the verdict cannot change, so pasted blobs stay cheap.
+MAX_ANALYZE_LENGTH = 100
+
+# Character-class sets for O(1) membership tests.
+LOWER_SET = frozenset(string.ascii_lowercase)
+UPPER_SET = frozenset(string.ascii_uppercase)
+DIGIT_SET = frozenset(string.digits)
+SYMBOL_SET = frozenset("!@#$%^&*()-_=+[]{}|;:,.<>?/")
+
+
+def _load_common_passwords():
+    """Load an optional breached/common password list as a frozenset.
+
+    Drop a `common_passwords.txt` (one password per line) beside the app to
+    enable the check; lookups stay O(1) regardless of list size.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common_passwords.txt')
+    try:
+        with open(path, encoding='utf-8') as f:
+            return frozenset(line.strip().lower() for line in f if line.strip())
+    except OSError:
+        return frozenset()
+
+
+def _load_pwned_bloom():
+    """Memory-map an optional pre-built bloom filter of breached hashes.
+
+    Drop a `pwned.bloom` file (a raw bit array built offline from the HIBP
+    dump, double-hashed with 7 probes over the SHA-1 digest) beside the app
+    and clearly-unbreached passwords skip the network round-trip entirely.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pwned.bloom')
+    try:
+        import mmap
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _bloom_may_contain(bloom, digest):
+    """Test a SHA-1 digest against the bloom filter (no false negatives)."""
+    nbits = len(bloom) * 8
+    h1 = int.from_bytes(digest[:8], 'big')
+    h2 = int.from_bytes(digest[8:16], 'big') | 1
+    for i in range(7):
+        idx = (h1 + i * h2) % nbits
+        if not bloom[idx >> 3] & (1 << (idx & 7)):
+            return False
+    return True
+
+
+# Weak-pattern detection, compiled once at import. All patterns are fused
+# into one alternation so detection is a single scan; the backreference in
+# the repeat pattern is renumbered for its absolute group position, and
+# _PATTERN_BY_GROUP maps any matched group index back to the source pattern.
+_COMMON_PATTERNS = (
+    r'123+', r'abc+', r'qwert+', r'password', r'admin',
+    r'(\w)\1{2,}', r'\d{4,}', r'[a-z]{5,}', r'[A-Z]{5,}'
+)
+_PATTERN_RE = re.compile(
+    r'(123+)|(abc+)|(qwert+)|(password)|(admin)|'
+    r'((\w)\7{2,})|(\d{4,})|([a-z]{5,})|([A-Z]{5,})',
+    re.IGNORECASE
+)
+_PATTERN_BY_GROUP = {
+    1: _COMMON_PATTERNS[0], 2: _COMMON_PATTERNS[1],
+    3: _COMMON_PATTERNS[2], 4: _COMMON_PATTERNS[3],
+    5: _COMMON_PATTERNS[4], 6: _COMMON_PATTERNS[5],
+    7: _COMMON_PATTERNS[5], 8: _COMMON_PATTERNS[6],
+    9: _COMMON_PATTERNS[7], 10: _COMMON_PATTERNS[8],
+}
+
+
+# Crack-time display buckets; thresholds are log10 of the bucket upper
+# bounds in seconds (minute, hour, day, year, century, million years).
+_LOG10_2 = math.log10(2)
+_CRACK_TIME_THRESHOLDS = tuple(math.log10(s) for s in (
+    60, 3600, 86400, 31536000, 31536000 * 100, 31536000 * 1000000))
+_CRACK_TIME_UNITS = (
+    (1, "seconds"),
+    (60, "minutes"),
+    (3600, "hours"),
+    (86400, "days"),
+    (31536000, "years"),
+    (31536000 * 1000, "thousand years"),
+)
+
+
+# Strength levels (label, color, index) built once at import; a language
+# change requires a restart, so translating here is safe. Entropy at or
+# above _STRENGTH_THRESHOLDS[i] ranks at least level i+1.
+_STRENGTH_THRESHOLDS = (28, 36, 50, 65, 80, 100, 120)
+_STRENGTH_LEVELS = (
+    (_("Critical"), "#c0392b", 0),
+    (_("Very Weak"), "#e74c3c", 1),
+    (_("Weak"), "#e67e22", 2),
+    (_("Fair"), "#f39c12", 3),
+    (_("Good"), "#f1c40f", 4),
+    (_("Strong"), "#2ecc71", 5),
+    (_("Very Strong"), "#27ae60", 6),
+    (_("Exceptional"), "#16a085", 7),
+)
+
+
+def _scan_class_mask(password):
+    """Return the 4-bit character-class mask for a password in one pass."""
+    buf = password.encode('latin-1', 'replace')
+    if len(buf) > 64:
+        # Long inputs (pasted blobs, wordlist scoring): translate the whole
+        # buffer to class flags in C and OR the at-most-four distinct values.
+        mask = 0
+        for flag in set(buf.translate(_CLASS_TABLE)):
+            mask |= flag
+        return mask
+    mask = 0
+    for b in buf:
+        mask |= _CLASS_TABLE[b]
+        if mask == 15:
+            break
+    return mask
+
+
 class AdvancedPasswordAnalyzer:
     """Comprehensive password analysis with pattern detection."""
-    
+
+    # Range responses cached on disk keyed by SHA-1 prefix; only hash
+    # prefixes and breach counts are stored, never passwords.
+    _HIBP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hibp_cache.db')
+
     def __init__(self):
-        self.common_patterns = [
-            r'123+', r'abc+', r'qwert+', r'password', r'admin',
-            r'(\w)\1{2,}', r'\d{4,}', r'[a-z]{5,}', r'[A-Z]{5,}'
-        ]
+        self.common_patterns = _COMMON_PATTERNS
+        self._pattern_re = _PATTERN_RE
+        self._pattern_by_group = _PATTERN_BY_GROUP
+        self.common_passwords = _load_common_passwords()
+        self._pwned_bloom = _load_pwned_bloom()
+        self._hibp_db = None
+        self._hibp_db_lock = threading.Lock()
+        # Per-instance LRU of parsed {suffix: count} dicts so repeat checks
+        # against a fetched prefix are pure dict lookups; _prefix_cache
+        # mirrors them for the synchronous lookup_cached fast path.
+        self._prefix_cache = {}
+        self._range_counts = lru_cache(maxsize=1024)(self._parse_range)
+
+    # In-memory entries are considered fresh for a day; the time bucket is
+    # part of the cache key, so stale entries simply stop being hit and age
+    # out of the LRU while the ETag-validated revalidation stays cheap.
+    _HIBP_TTL = 86400
+
+    def _parse_range(self, prefix, ttl_bucket=None):
+        """Fetch a range and parse it into a {suffix_bytes: count} dict."""
+        counts = {
+            line[:35]: int(line[36:])
+            for line in self._fetch_range(prefix).splitlines() if line
+        }
+        self._prefix_cache[prefix] = counts
+        return counts
+
+    def lookup_cached(self, password):
+        """Answer a breach check from local state only, or None on a miss.
+
+        Costs one SHA-1 plus dict lookups, so callers can resolve repeat
+        checks synchronously without scheduling the network worker.
+        """
+        if not password:
+            return None
+        digest = hashlib.sha1(password.encode('utf-8')).digest()
+        if self._pwned_bloom is not None and not _bloom_may_contain(self._pwned_bloom, digest):
+            return 0
+        sha1 = digest.hex().upper()
+        counts = self._prefix_cache.get(sha1[:5])
+        if counts is None:
+            return None
+        return counts.get(sha1[5:].encode('ascii'), 0)
+
+    def _hibp_cache(self):
+        """Lazily open the on-disk HIBP range cache."""
+        if self._hibp_db is None:
+            db = sqlite3.connect(self._HIBP_CACHE_PATH, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS ranges ("
+                "prefix TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched_at INT)"
+            )
+            db.commit()
+            self._hibp_db = db
+        return self._hibp_db
+
+    def _fetch_range(self, prefix):
+        """Fetch a HIBP range body, revalidating the cached copy via ETag."""
+        with self._hibp_db_lock:
+            db = self._hibp_cache()
+            row = db.execute("SELECT etag, body FROM ranges WHERE prefix=?", (prefix,)).fetchone()
+
+        url = f"https://api.pwnedpasswords.com/range/{prefix}"
+        headers = {'If-None-Match': row[0]} if row and row[0] else {}
+        if _HTTP_CLIENT is not None:
+            response = _HTTP_CLIENT.get(url, headers=headers)
+        else:
+            response = _HIBP_SESSION.get(url, headers=headers, timeout=(3, 5))
+        if response.status_code == 304 and row:
+            return gzip.decompress(row[1])
+        response.raise_for_status()
+
+        body = response.content
+        with self._hibp_db_lock:
+            db.execute(
+                "INSERT OR REPLACE INTO ranges (prefix, etag, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (prefix, response.headers.get('ETag'), gzip.compress(body), int(time.time())),
+            )
+            db.commit()
+        return body
     
     def calculate_entropy(self, password):
         """Calculate Shannon entropy."""
         if not password:
             return 0.0
         
-        pool_size = 0
-        if re.search(r'[a-z]', password):
-            pool_size += 26
-        if re.search(r'[A-Z]', password):
-            pool_size += 26
-        if re.search(r'\d', password):
-            pool_size += 10
-        if re.search(r'[^a-zA-Z\d]', password):
-            pool_size += 32
-        
-        if pool_size == 0:
+        mask = _scan_class_mask(password)
+        if mask == 0:
             return 0.0
-        
-        entropy = len(password) * math.log2(pool_size)
-        return round(entropy, 2)
+
+        return round(len(password) * _LOG2_POOL_BY_MASK[mask], 2)
     
     def calculate_character_entropy(self, password):
         """Calculate actual Shannon entropy based on character frequency."""
         if not password:
             return 0.0
         
-        freq = Counter(password)
+        password = password[:MAX_ANALYZE_LENGTH]
+
+        # -L * sum((c/L) * log2(c/L)) rearranged to L*log2(L) - sum(c*log2(c)):
+        # one log2 per distinct character and no per-term divisions.
         length = len(password)
-        entropy = -sum((count/length) * math.log2(count/length) for count in freq.values())
-        return round(entropy * length, 2)
+        counts = Counter(password).values()
+        entropy = length * math.log2(length) - sum(c * math.log2(c) for c in counts)
+        return round(entropy, 2)
     
     def detect_patterns(self, password):
         """Detect common weak patterns."""
-        patterns = []
-        for pattern in self.common_patterns:
-            if re.search(pattern, password, re.IGNORECASE):
-                patterns.append(pattern)
-        return patterns
+        found = {}
+        for match in self._pattern_re.finditer(password):
+            found[self._pattern_by_group[match.lastindex]] = None
+        return list(found)
     
     def get_crack_time(self, entropy):
         """Estimate time to crack with modern hardware."""
-        # Assuming 100 billion guesses per second (modern GPU)
-        guesses_per_sec = 100_000_000_000
-        combinations = 2 ** entropy
-        seconds = combinations / guesses_per_sec
-        
-        if seconds < 60:
-            return f"{seconds:.2f} seconds"
-        elif seconds < 3600:
-            return f"{seconds/60:.2f} minutes"
-        elif seconds < 86400:
-            return f"{seconds/3600:.2f} hours"
-        elif seconds < 31536000:
-            return f"{seconds/86400:.2f} days"
-        elif seconds < 31536000 * 100:
-            return f"{seconds/31536000:.2f} years"
-        elif seconds < 31536000 * 1000000:
-            return f"{seconds/(31536000*1000):.2f} thousand years"
-        else:
+        # Work in log10 space: entropy*log10(2) - 11 is log10 of the crack
+        # time at 100 billion guesses/sec, so high-entropy inputs never
+        # build huge intermediate values and bucketing is one bisect.
+        log10_seconds = entropy * _LOG10_2 - 11
+        idx = bisect.bisect_right(_CRACK_TIME_THRESHOLDS, log10_seconds)
+        if idx == len(_CRACK_TIME_UNITS):
             return "millions of years+"
-    
+
+        divisor, unit = _CRACK_TIME_UNITS[idx]
+        return f"{10 ** log10_seconds / divisor:.2f} {unit}"
+
     def get_strength_feedback(self, entropy):
         """Enhanced strength classification."""
-        if entropy < 28:
-            return _("Critical"), "#c0392b", 0
-        elif entropy < 36:
-            return _("Very Weak"), "#e74c3c", 1
-        elif entropy < 50:
-            return _("Weak"), "#e67e22", 2
-        elif entropy < 65:
-            return _("Fair"), "#f39c12", 3
-        elif entropy < 80:
-            return _("Good"), "#f1c40f", 4
-        elif entropy < 100:
-            return _("Strong"), "#2ecc71", 5
-        elif entropy < 120:
-            return _("Very Strong"), "#27ae60", 6
-        else:
-            return _("Exceptional"), "#16a085", 7
+        return _STRENGTH_LEVELS[bisect.bisect_right(_STRENGTH_THRESHOLDS, entropy)]
     
+    def analyze(self, password):
+        """Run the full analysis in one pass and return everything the UI
+        needs, so per-keystroke work never scans the password twice."""
+        mask = _scan_class_mask(password)
+        entropy = round(len(password) * _LOG2_POOL_BY_MASK[mask], 2) if password else 0.0
+        patterns = self.detect_patterns(password)
+        unique_count = len(set(password))
+        return {
+            'entropy': entropy,
+            'char_entropy': self.calculate_character_entropy(password),
+            'mask': mask,
+            'patterns': patterns,
+            'unique_count': unique_count,
+            'feedback': self.get_strength_feedback(entropy),
+            'crack_time': self.get_crack_time(entropy),
+            'suggestions': self._build_suggestions(password, mask, patterns, unique_count),
+        }
+
     def get_suggestions(self, password):
         """Provide intelligent improvement suggestions."""
+        return self._build_suggestions(
+            password, _scan_class_mask(password), self.detect_patterns(password),
+            len(set(password)))
+
+    def _build_suggestions(self, password, mask, patterns, unique_count):
+        """Build suggestion strings from already-computed analysis facts."""
         suggestions = []
 
         if len(password) < 12:
             suggestions.append("• " + _("Increase length to at least 12 characters"))
-        if not re.search(r'[a-z]', password):
+        if not mask & _CLASS_LOWER:
             suggestions.append("• " + _("Add lowercase letters"))
-        if not re.search(r'[A-Z]', password):
+        if not mask & _CLASS_UPPER:
             suggestions.append("• " + _("Add uppercase letters"))
-        if not re.search(r'\d', password):
+        if not mask & _CLASS_DIGIT:
             suggestions.append("• " + _("Add numbers"))
-        if not re.search(r'[^a-zA-Z\d]', password):
+        if not mask & _CLASS_SYMBOL:
             suggestions.append("• " + _("Add special characters"))
-        if self.detect_patterns(password):
+        if password.lower() in self.common_passwords:
+            suggestions.append("• " + _("This password appears on common-password lists"))
+        if patterns:
             suggestions.append("• " + _("Avoid common patterns and sequences"))
-        if len(set(password)) < len(password) * 0.6:
+        if unique_count < len(password) * 0.6:
             suggestions.append("• " + _("Use more unique characters"))
 
         return suggestions if suggestions else ["• " + _("Your password is excellent!")]
@@ -258,19 +546,21 @@ class AdvancedPasswordAnalyzer:
             return None, "Password is empty."
         
         try:
-            sha1 = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+            # hashlib.sha1 is the OpenSSL-backed implementation, so the hash
+            # itself runs on SHA-NI where available; hex() on the raw digest
+            # is a single C pass versus hexdigest().upper()'s two.
+            digest = hashlib.sha1(password.encode('utf-8')).digest()
+
+            # A bloom miss proves the hash is not in the dump the filter was
+            # built from — answer "not found" without touching the network.
+            if self._pwned_bloom is not None and not _bloom_may_contain(self._pwned_bloom, digest):
+                return 0, None
+
+            sha1 = digest.hex().upper()
             prefix, suffix = sha1[:5], sha1[5:]
             
-            url = f"https://api.pwnedpasswords.com/range/{prefix}"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            hashes = (line.split(':') for line in response.text.splitlines())
-            for h, count in hashes:
-                if h == suffix:
-                    return int(count), None
-            
-            return 0, None
+            counts = self._range_counts(prefix, int(time.time() // self._HIBP_TTL))
+            return counts.get(suffix.encode('ascii'), 0), None
         except requests.RequestException as e:
             return None, f"API error: {e}"
         except Exception as e:
@@ -300,6 +590,82 @@ class PassPilotSupreme(tk.Tk):
         
         # Clipboard timer
         self.clipboard_timer = None
+
+        # Pending debounced analysis callback
+        self._analyze_after_id = None
+
+        # Translated strings for the per-keystroke analyze path, looked up
+        # once (language changes require a restart anyway)
+        self._fmt_strength = _("{0} Password")
+        self._fmt_entropy = _("Entropy: {0} bits (pool-based)")
+        self._fmt_crack = _("Est. crack time: {0}")
+        self._fmt_diversity = _("Character diversity: {0} bits (Shannon)")
+        self._txt_enter_password = _("Enter a password to analyze")
+        self._txt_entropy_blank = _("Entropy: - bits")
+        self._txt_crack_blank = _("Est. crack time: -")
+        self._txt_diversity_blank = _("Character diversity: -")
+
+        # Breach-check strings, same treatment
+        self._txt_checking = "🔄 " + _("Checking...")
+        self._txt_checking_db = _("Checking breach database...")
+        self._txt_check_failed = _("Breach check failed")
+        self._fmt_exposed = _("⚠️ EXPOSED! Found {0} times in breaches")
+        self._txt_compromised = _("Password is compromised!")
+        self._txt_safe = _("✅ Safe! Not found in known breaches")
+        self._txt_check_passed = _("Password passed breach check")
+
+        # Transient status-bar flashes stand in for informational dialogs
+        self._txt_ready = _("Ready")
+        self._status_flash_id = None
+
+        # Dialog text for the Help menu, built once instead of per click
+        self._help_title = _("Help")
+        self._help_text = _("""
+        PassPilot Supreme - Keyboard Shortcuts
+        =====================================
+
+        Ctrl+G    Generate Password
+        Ctrl+P    Generate Passphrase
+        Ctrl+C    Copy to Clipboard
+        F1        Show This Help
+
+        Features:
+        • Military-grade password generation
+        • Real-time strength analysis
+        • Breach database checking (Have I Been Pwned)
+        • Pattern detection & suggestions
+        • Secure clipboard with auto-clear
+        • Session-only password history
+        """)
+        self._about_title = _("About")
+        self._about_text = _("""
+        PassPilot Supreme v2.0
+        The Ultimate Password Security Toolkit
+
+        Features:
+        ✓ Cryptographically secure password generation
+        ✓ Advanced entropy calculation
+        ✓ Real-time strength analysis
+        ✓ Pattern detection
+        ✓ Breach database integration
+        ✓ Smart suggestions
+        ✓ Secure clipboard management
+        ✓ Beautiful modern interface
+
+        Built with Python & Tkinter
+        © 2025 PassPilot Supreme
+        """)
+
+        # Last text written to each analyzer widget, to skip no-op updates
+        self._last_widget_text = {}
+
+        # One long-lived worker drains breach checks from a queue; a token
+        # lets queued-but-stale requests be skipped before hitting the
+        # network, naturally coalescing bursts of clicks.
+        self._pwn_queue = queue.Queue()
+        self._pwn_token = 0
+        worker = threading.Thread(target=self._pwned_worker_loop, daemon=True)
+        worker.start()
         
         # Setup UI
         self.setup_styles()
@@ -413,7 +779,7 @@ class PassPilotSupreme(tk.Tk):
         self.create_history_tab()
         
         # Status bar
-        self.status_bar = ttk.Label(self, text=_("Ready"), relief="sunken", anchor="w")
+        self.status_bar = ttk.Label(self, text=self._txt_ready, relief="sunken", anchor="w")
         self.status_bar.pack(side="bottom", fill="x")
     
     def create_generator_tab(self):
@@ -513,6 +879,14 @@ class PassPilotSupreme(tk.Tk):
         self.strength_canvas = tk.Canvas(viz_frame, height=40, bg="#2c3e50", highlightthickness=0)
         self.strength_canvas.pack(fill="x", pady=(0, 10))
 
+        # Persistent meter items (created on first draw/resize); updates only
+        # reconfigure them instead of rebuilding the canvas scene.
+        self._strength_bar_item = None
+        self._strength_grid_item = None
+        self._strength_width = 0
+        self._strength_state = (0, "")
+        self.strength_canvas.bind("<Configure>", self._rebuild_strength_items)
+
         self.feedback_label = ttk.Label(viz_frame, text=_("Enter a password to analyze"),
                                        font=("Segoe UI", 12, "bold"), anchor="center")
         self.feedback_label.pack(fill="x")
@@ -602,17 +976,21 @@ class PassPilotSupreme(tk.Tk):
     
     def generate_password(self):
         """Generate a new password."""
-        if not any([self.lower_var.get(), self.upper_var.get(),
-                    self.digits_var.get(), self.symbols_var.get()]):
+        # Read each Tk variable once; every .get() is a Tcl round-trip.
+        use_lower = self.lower_var.get()
+        use_upper = self.upper_var.get()
+        use_digits = self.digits_var.get()
+        use_symbols = self.symbols_var.get()
+        if not (use_lower or use_upper or use_digits or use_symbols):
             messagebox.showwarning(_("Warning"), _("Please select at least one character type!"))
             return
-        
+
         password = self.generator.generate(
             self.length_var.get(),
-            self.lower_var.get(),
-            self.upper_var.get(),
-            self.digits_var.get(),
-            self.symbols_var.get(),
+            use_lower,
+            use_upper,
+            use_digits,
+            use_symbols,
             self.exclude_ambiguous.get()
         )
         
@@ -622,8 +1000,8 @@ class PassPilotSupreme(tk.Tk):
         self.analyze_entry.delete(0, tk.END)
         self.analyze_entry.insert(0, password)
         
-        self.status_bar.config(text=_("Password generated ({0} characters)").format(len(password)))
-        self.refresh_history()
+        self._set_status(_("Password generated ({0} characters)").format(len(password)))
+        self._append_history_entry()
     
     def generate_passphrase(self):
         """Generate a memorable passphrase."""
@@ -635,8 +1013,8 @@ class PassPilotSupreme(tk.Tk):
         self.analyze_entry.delete(0, tk.END)
         self.analyze_entry.insert(0, passphrase)
         
-        self.status_bar.config(text=_("Passphrase generated"))
-        self.refresh_history()
+        self._set_status(_("Passphrase generated"))
+        self._append_history_entry()
     
     def copy_to_clipboard(self):
         """Copy password to clipboard with auto-clear timer."""
@@ -647,7 +1025,7 @@ class PassPilotSupreme(tk.Tk):
 
         self.clipboard_clear()
         self.clipboard_append(password)
-        self.status_bar.config(text=_("Copied! Clipboard will clear in 30 seconds..."))
+        self._set_status(_("Copied! Clipboard will clear in 30 seconds..."))
         
         # Auto-clear after 30 seconds
         if self.clipboard_timer:
@@ -657,134 +1035,234 @@ class PassPilotSupreme(tk.Tk):
     def clear_clipboard(self):
         """Clear clipboard for security."""
         self.clipboard_clear()
-        self.status_bar.config(text=_("Clipboard cleared for security"))
+        self._set_status(_("Clipboard cleared for security"))
     
     def analyze_password(self, *args):
-        """Analyze password in real-time."""
-        password = self.analyze_entry_var.get()
+        """Schedule a debounced analysis so bursts of keystrokes coalesce."""
+        if self._analyze_after_id:
+            self.after_cancel(self._analyze_after_id)
+        self._analyze_after_id = self.after(120, self._do_analyze)
+
+    def _set_label(self, label, text, foreground=None):
+        """Configure a label only when its text/color actually changed."""
+        state = (text, foreground)
+        if self._last_widget_text.get(label) == state:
+            return
+        self._last_widget_text[label] = state
+        if foreground is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, foreground=foreground)
+
+    def _set_status(self, text):
+        """Write the status bar, cancelling any pending flash revert."""
+        if self._status_flash_id is not None:
+            self.after_cancel(self._status_flash_id)
+            self._status_flash_id = None
+        self.status_bar.config(text=text)
+
+    def _flash_status(self, text, ms=2000):
+        """Show a transient message in the status bar without a modal dialog."""
+        self._set_status(text)
+        self._status_flash_id = self.after(ms, self._restore_status)
+
+    def _restore_status(self):
+        self._status_flash_id = None
+        self.status_bar.config(text=self._txt_ready)
+
+    def _set_suggestions(self, text):
+        """Replace the suggestions text in one widget call, if changed."""
+        if self._last_widget_text.get(self.suggestions_text) == text:
+            return
+        self._last_widget_text[self.suggestions_text] = text
+        self.suggestions_text.replace("1.0", tk.END, text)
+
+    def _do_analyze(self):
+        """Analyze the current password and refresh the UI."""
+        self._analyze_after_id = None
+        # Editing the entry invalidates any in-flight breach check
+        self._pwn_token += 1
+        full_input = self.analyze_entry_var.get()
+        password = full_input[:MAX_ANALYZE_LENGTH]
         
         if not password:
-            self.strength_canvas.delete("all")
-            self.feedback_label.config(text=_("Enter a password to analyze"), foreground="#95a5a6")
-            self.entropy_label.config(text=_("Entropy: - bits"))
-            self.crack_time_label.config(text=_("Est. crack time: -"))
-            self.char_entropy_label.config(text=_("Character diversity: -"))
-            self.suggestions_text.delete(1.0, tk.END)
-            self.pwned_label.config(text="")
+            self._clear_strength_bar()
+            self._set_label(self.feedback_label, self._txt_enter_password, "#95a5a6")
+            self._set_label(self.entropy_label, self._txt_entropy_blank)
+            self._set_label(self.crack_time_label, self._txt_crack_blank)
+            self._set_label(self.char_entropy_label, self._txt_diversity_blank)
+            self._set_suggestions("")
+            self._set_label(self.pwned_label, "")
             return
         
-        # Calculate metrics
-        entropy = self.analyzer.calculate_entropy(password)
-        char_entropy = self.analyzer.calculate_character_entropy(password)
-        strength_text, color, level = self.analyzer.get_strength_feedback(entropy)
-        crack_time = self.analyzer.get_crack_time(entropy)
-        suggestions = self.analyzer.get_suggestions(password)
+        # Calculate all metrics in one analyzer pass
+        analysis = self.analyzer.analyze(password)
+        entropy = analysis['entropy']
+        char_entropy = analysis['char_entropy']
+        strength_text, color, level = analysis['feedback']
+        crack_time = analysis['crack_time']
+        suggestions = analysis['suggestions']
         
         # Update visualization
         self.draw_strength_bar(level, color)
-        self.feedback_label.config(text=_("{0} Password").format(strength_text), foreground=color)
+        self._set_label(self.feedback_label, self._fmt_strength.format(strength_text), color)
 
         # Update metrics
-        self.entropy_label.config(text=_("Entropy: {0} bits (pool-based)").format(entropy))
-        self.crack_time_label.config(text=_("Est. crack time: {0}").format(crack_time))
-        self.char_entropy_label.config(text=_("Character diversity: {0} bits (Shannon)").format(char_entropy))
-        
+        self._set_label(self.entropy_label, self._fmt_entropy.format(entropy))
+        self._set_label(self.crack_time_label, self._fmt_crack.format(crack_time))
+        self._set_label(self.char_entropy_label, self._fmt_diversity.format(char_entropy))
+
         # Update suggestions
-        self.suggestions_text.delete(1.0, tk.END)
-        self.suggestions_text.insert(1.0, "\n".join(suggestions))
-        
+        if len(full_input) > MAX_ANALYZE_LENGTH:
+            suggestions = suggestions + [
+                "• " + _("Analysis limited to the first {0} characters").format(MAX_ANALYZE_LENGTH)]
+        self._set_suggestions("\n".join(suggestions))
+
         # Clear breach check result
-        self.pwned_label.config(text="")
+        self._set_label(self.pwned_label, "")
     
+    def _rebuild_strength_items(self, event=None):
+        """(Re)create the persistent strength meter items for the current width."""
+        # Width comes from the <Configure> event; every later redraw reads
+        # the cached self._strength_width instead of round-tripping into
+        # Tcl. When called before the canvas is mapped (no event yet) its
+        # requested width of 500 is the only sensible answer anyway.
+        width = event.width if event is not None else 500
+        height = 40
+
+        # <Configure> also fires for moves/height changes; the scene only
+        # depends on width, so skip rebuilding when it is unchanged.
+        if width == self._strength_width and self._strength_bar_item is not None:
+            return
+
+        self._strength_width = width
+        canvas = self.strength_canvas
+        canvas.delete("all")
+
+        # Background, then the strength bar, then the grid on top. The
+        # static ornaments are state='disabled' so Tk skips them entirely
+        # when hit-testing events over the canvas.
+        canvas.create_rectangle(0, 0, width, height, fill="#34495e", outline="",
+                                tags=("static",), state="disabled")
+        self._strength_bar_item = canvas.create_rectangle(0, 0, 0, height, fill="", outline="")
+
+        # All eight ticks as one polyline: each vertical stroke is drawn
+        # down and retraced up, so Tk allocates a single canvas item.
+        step = width / 7
+        points = [c for i in range(8) for c in (step * i, 0, step * i, height, step * i, 0)]
+        self._strength_grid_item = canvas.create_line(*points, fill="#2c3e50", width=2,
+                                                      tags=("static",), state="disabled")
+
+        # Re-apply the last drawn state after a resize
+        level, color = self._strength_state
+        if color:
+            self._apply_strength_bar(level, color)
+
+    def _apply_strength_bar(self, level, color):
+        """Update the persistent bar item for a strength level."""
+        bar_width = (self._strength_width / 7) * (level + 1)
+        self.strength_canvas.coords(self._strength_bar_item, 0, 0, bar_width, 40)
+        self.strength_canvas.itemconfig(self._strength_bar_item, fill=color)
+
+    def _clear_strength_bar(self):
+        """Collapse the bar to zero width for the empty-input state."""
+        self._strength_state = (0, "")
+        if self._strength_bar_item is not None:
+            self.strength_canvas.coords(self._strength_bar_item, 0, 0, 0, 40)
+
     def draw_strength_bar(self, level, color):
         """Draw animated strength indicator."""
-        width = self.strength_canvas.winfo_width()
-        if width <= 1:
-            width = 500
-        height = 40
-        
-        self.strength_canvas.delete("all")
-        
-        # Background
-        self.strength_canvas.create_rectangle(0, 0, width, height, fill="#34495e", outline="")
-        
-        # Strength bar
-        bar_width = (width / 7) * (level + 1)
-        self.strength_canvas.create_rectangle(0, 0, bar_width, height, fill=color, outline="")
-        
-        # Grid lines
-        for i in range(8):
-            x = (width / 7) * i
-            self.strength_canvas.create_line(x, 0, x, height, fill="#2c3e50", width=2)
+        if self._strength_bar_item is None:
+            self._rebuild_strength_items()
+        # Typing within the same strength band is the common case; the bar
+        # already shows this exact state, so skip the redundant Tk calls.
+        if (level, color) == self._strength_state:
+            return
+        self._strength_state = (level, color)
+        self._apply_strength_bar(level, color)
     
     def check_pwned_threaded(self):
         """Check password breach status in background thread."""
         password = self.analyze_entry.get()
         if not password:
-            messagebox.showinfo(_("Info"), _("Please enter a password to check."))
+            self._flash_status(_("Please enter a password to check."))
             return
 
-        self.pwned_label.config(text="🔄 " + _("Checking..."), foreground="#3498db")
-        self.status_bar.config(text=_("Checking breach database..."))
-        
-        # Run in thread to avoid blocking UI
-        thread = threading.Thread(target=self.check_pwned_worker, args=(password,))
-        thread.daemon = True
-        thread.start()
-    
-    def check_pwned_worker(self, password):
-        """Worker thread for breach check."""
-        count, error = self.analyzer.check_if_pwned(password)
+        self._set_label(self.pwned_label, self._txt_checking, "#3498db")
+        self._set_status(self._txt_checking_db)
         
-        # Update UI in main thread
-        self.after(0, self.update_pwned_result, count, error)
+        # Answer instantly from local caches when possible
+        cached = self.analyzer.lookup_cached(password)
+        if cached is not None:
+            self.update_pwned_result(cached, None)
+            return
+
+        # Otherwise hand off to the persistent worker to avoid blocking UI
+        self._pwn_token += 1
+        self._pwn_queue.put((password, self._pwn_token))
+
+    def _pwned_worker_loop(self):
+        """Long-lived worker: drain queued breach checks, skipping stale ones."""
+        while True:
+            password, token = self._pwn_queue.get()
+            if token != self._pwn_token:
+                continue
+            count, error = self.analyzer.check_if_pwned(password)
+            self.after(0, self.update_pwned_result, count, error, token)
     
-    def update_pwned_result(self, count, error):
-        """Update UI with breach check results."""
+    def update_pwned_result(self, count, error, token=None):
+        """Update UI with breach check results, dropping stale dispatches."""
+        if token is not None and token != self._pwn_token:
+            return
         if error:
-            self.pwned_label.config(text="❌ " + error, foreground="#e74c3c")
-            self.status_bar.config(text=_("Breach check failed"))
+            self._set_label(self.pwned_label, "❌ " + error, "#e74c3c")
+            self._set_status(self._txt_check_failed)
         elif count > 0:
-            msg = _("⚠️ EXPOSED! Found {0} times in breaches").format(f"{count:,}")
-            self.pwned_label.config(text=msg, foreground="#e74c3c")
-            self.status_bar.config(text=_("Password is compromised!"))
+            msg = self._fmt_exposed.format(f"{count:,}")
+            self._set_label(self.pwned_label, msg, "#e74c3c")
+            self._set_status(self._txt_compromised)
         else:
-            msg = _("✅ Safe! Not found in known breaches")
-            self.pwned_label.config(text=msg, foreground="#2ecc71")
-            self.status_bar.config(text=_("Password passed breach check"))
+            self._set_label(self.pwned_label, self._txt_safe, "#2ecc71")
+            self._set_status(self._txt_check_passed)
     
+    def _append_history_entry(self):
+        """Insert just the newest history entry instead of a full rebuild."""
+        self.history_listbox.insert(0, self.generator.history[0][2])
+        # The bounded deque may have dropped its oldest entry
+        if self.history_listbox.size() > len(self.generator.history):
+            self.history_listbox.delete(tk.END)
+
     def refresh_history(self):
         """Refresh the history display."""
         self.history_listbox.delete(0, tk.END)
-        for item in self.generator.history:
-            display = f"[{item['time']}] {item['password'][:40]}..." if len(item['password']) > 40 else f"[{item['time']}] {item['password']}"
-            self.history_listbox.insert(tk.END, display)
+        for entry in self.generator.history:
+            self.history_listbox.insert(tk.END, entry[2])
     
     def copy_from_history(self):
         """Copy selected password from history."""
         selection = self.history_listbox.curselection()
         if not selection:
-            messagebox.showinfo(_("Info"), _("Please select a password from history."))
+            self._flash_status(_("Please select a password from history."))
             return
 
         idx = selection[0]
-        password = self.generator.history[idx]['password']
+        password = self.generator.history[idx][1]
 
         self.clipboard_clear()
         self.clipboard_append(password)
-        messagebox.showinfo(_("Success"), _("Password copied from history!"))
+        self._flash_status(_("Password copied from history!"))
     
     def clear_history(self):
         """Clear password history."""
         if messagebox.askyesno(_("Confirm"), _("Clear all password history?")):
             self.generator.history.clear()
             self.refresh_history()
-            self.status_bar.config(text=_("History cleared"))
+            self._set_status(_("History cleared"))
     
     def export_history(self):
         """Export history to JSON file."""
         if not self.generator.history:
-            messagebox.showinfo(_("Info"), _("No history to export."))
+            self._flash_status(_("No history to export."))
             return
 
         from tkinter import filedialog
@@ -795,9 +1273,16 @@ class PassPilotSupreme(tk.Tk):
 
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    json.dump(self.generator.history, f, indent=2)
-                messagebox.showinfo(_("Success"), _("History exported to {0}").format(filename))
+                # Preserve the existing export format
+                entries = [{"password": password, "time": timestamp}
+                           for timestamp, password, _display in self.generator.history]
+                if orjson is not None:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(entries, f, indent=2)
+                self._flash_status(_("History exported to {0}").format(filename))
             except Exception as e:
                 messagebox.showerror(_("Error"), _("Export failed: {0}").format(e))
     
@@ -808,52 +1293,19 @@ class PassPilotSupreme(tk.Tk):
     
     def show_help(self):
         """Display keyboard shortcuts."""
-        help_text = _("""
-        PassPilot Supreme - Keyboard Shortcuts
-        =====================================
+        messagebox.showinfo(self._help_title, self._help_text)
 
-        Ctrl+G    Generate Password
-        Ctrl+P    Generate Passphrase
-        Ctrl+C    Copy to Clipboard
-        F1        Show This Help
-
-        Features:
-        • Military-grade password generation
-        • Real-time strength analysis
-        • Breach database checking (Have I Been Pwned)
-        • Pattern detection & suggestions
-        • Secure clipboard with auto-clear
-        • Session-only password history
-        """)
-        messagebox.showinfo(_("Help"), help_text)
-    
     def show_about(self):
         """Show about dialog."""
-        about_text = _("""
-        PassPilot Supreme v2.0
-        The Ultimate Password Security Toolkit
-
-        Features:
-        ✓ Cryptographically secure password generation
-        ✓ Advanced entropy calculation
-        ✓ Real-time strength analysis
-        ✓ Pattern detection
-        ✓ Breach database integration
-        ✓ Smart suggestions
-        ✓ Secure clipboard management
-        ✓ Beautiful modern interface
-
-        Built with Python & Tkinter
-        © 2025 PassPilot Supreme
-        """)
-        messagebox.showinfo(_("About"), about_text)
+        messagebox.showinfo(self._about_title, self._about_text)
 
     def change_language(self):
         """Change application language - requires restart."""
         selected_lang = self.language_var.get()
-        messagebox.showinfo(_("Language Change"),
-                          _("Language changed to {0}. Please restart the application for changes to take effect.").format(
-                              "हिंदी" if selected_lang == 'hi' else "English"))
+        self._flash_status(
+            _("Language changed to {0}. Please restart the application for changes to take effect.").format(
+                "हिंदी" if selected_lang == 'hi' else "English"),
+            ms=5000)
 
 # --- Main Execution ---
 